@@ -0,0 +1,17 @@
+"""
+Indirection over typeguard's ``@typechecked`` decorator, allowing runtime
+type checking (and the typeguard import itself) to be switched off for
+production runs via ``python -O`` or the WDMTA_NO_TYPECHECK environment
+variable.
+"""
+
+import os
+
+if not __debug__ or os.environ.get("WDMTA_NO_TYPECHECK"):
+
+    def typechecked(target):
+        """No-op stand-in for typeguard.typechecked."""
+        return target
+
+else:
+    from typeguard import typechecked
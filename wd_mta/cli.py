@@ -3,189 +3,392 @@ Command-line interface for launching the WD-MTA
 Discord bot with various user-defined parameters.
 """
 
+import functools
 import logging
 import os
 import sys
-from optparse import OptionParser
 from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from optparse import OptionParser
+
+# Static copy of the OptionParser help output, so that the overwhelmingly
+# common `--help` invocation can be served without any parser work.
+# Keep this in sync with the option definitions in _full_parser().
+_STATIC_HELP = """\
+Usage: python -m wd_mta [OPTION]...
+
+Start WD-MTA (WhatsApp-Discord Message Transfer Automation), a Discord bot to
+forward chat messages between WhatsApp and Discord.
+
+Options:
+  -h, --help            show this help message and exit
+  -L LEVEL, --log-level=LEVEL
+                        set the log level; one of: critical, error, warning,
+                        info, debug (default: info)
+  -c FILE, --config=FILE
+                        the path to the JSON configuration file (default:
+                        config.json)
+
+  Discord bot options:
+    -t TOKEN, --token=TOKEN
+                        the bot token (default: taken from
+                        WDMTA_DISCORD_TOKEN)
+    -s GUILD_ID, --sync-to-guild=GUILD_ID
+                        sync application commands to the guild GUILD_ID upon
+                        startup
+    -a USER_ID, --admin=USER_ID
+                        allow the user USER_ID to run admin commands, in
+                        addition to the bot owner (can be given multiple times
+                        to specify multiple admins)
+    --allow-all         allow all users to run admin commands
+    --reconnect         enable automatic reconnection (default)
+    --no-reconnect      disable automatic reconnection
+    --enable-test-commands
+                        enable commands intended for testing purposes
+
+  WuzAPI options:
+    -u URL, --url=URL   the endpoint URL (default: http://localhost:8080)
+    -x TOKEN            the user token (default: taken from
+                        WDMTA_WUZAPI_TOKEN)
+    --webhook-host=HOSTNAME
+                        host the webhook on HOSTNAME (default: localhost)
+    --webhook-port=NUMBER
+                        host the webhook on port NUMBER (default: 8000)
+    -m SIZE, --media-maxsize=SIZE
+                        do not download media files beyond SIZE bytes
+                        (default: 10000000)
+    -l NUMBER, --message-limit=NUMBER
+                        keep track of no more than NUMBER messages, on a per-
+                        chat basis (used for handling replies) (default: 1000)
+    -d FILE, --dump-file=FILE
+                        append received WuzAPI event data to FILE (for
+                        development purposes)
+"""
 
-from aiohttp import ClientSession
-
-from .cogs.core import CoreCog
-from .cogs.test import TestCog
-from .cogs.whatsapp import WhatsAppCog
-from .discord import WDMTABot
-from .whatsapp import WhatsAppClient
+_DESCRIPTION = (
+    "Start WD-MTA (WhatsApp-Discord Message Transfer Automation),"
+    " a Discord bot to forward chat messages between WhatsApp and Discord."
+)
 
-parser = OptionParser(
-    prog=(
+_DEFAULTS: dict[str, object] = {
+    "log_level": "info",
+    "config": "config.json",
+    "discord_token": None,
+    "sync_to_guild": None,
+    "admin": None,
+    "allow_all": None,
+    "reconnect": True,
+    "enable_test_commands": None,
+    "wuzapi_url": "http://127.0.0.1:8080",
+    "wuzapi_token": None,
+    "wuzapi_webhook_host": "localhost",
+    "wuzapi_webhook_port": 8000,
+    "media_maxsize": 10_000_000,
+    "message_limit": 1000,
+    "dump_file": None,
+}
+
+# Value-taking flags, mapped to their destination attribute and value type.
+# -a/--admin is special-cased in _parse_args as it appends to a list.
+_VALUE_FLAGS: dict[str, tuple[str, type]] = {
+    "-L": ("log_level", str),
+    "--log-level": ("log_level", str),
+    "-c": ("config", str),
+    "--config": ("config", str),
+    "-t": ("discord_token", str),
+    "--token": ("discord_token", str),
+    "-s": ("sync_to_guild", int),
+    "--sync-to-guild": ("sync_to_guild", int),
+    "-a": ("admin", int),
+    "--admin": ("admin", int),
+    "-u": ("wuzapi_url", str),
+    "--url": ("wuzapi_url", str),
+    "-x": ("wuzapi_token", str),
+    "--webhook-host": ("wuzapi_webhook_host", str),
+    "--webhook-port": ("wuzapi_webhook_port", int),
+    "-m": ("media_maxsize", int),
+    "--media-maxsize": ("media_maxsize", int),
+    "-l": ("message_limit", int),
+    "--message-limit": ("message_limit", int),
+    "-d": ("dump_file", str),
+    "--dump-file": ("dump_file", str),
+}
+
+_SWITCH_FLAGS: dict[str, tuple[str, bool]] = {
+    "--allow-all": ("allow_all", True),
+    "--reconnect": ("reconnect", True),
+    "--no-reconnect": ("reconnect", False),
+    "--enable-test-commands": ("enable_test_commands", True),
+}
+
+
+def _prog_name() -> str:
+    return (
         f"{os.path.basename(sys.executable)} -m {__package__}"
         if (prog_path := Path(sys.argv[0])).stem == "__main__"
         else prog_path.name
-    ),
-    usage="%prog [OPTION]...",
-    description="Start WD-MTA (WhatsApp-Discord Message Transfer Automation),"
-    " a Discord bot to forward chat messages between WhatsApp and Discord.",
-)
+    )
 
-parser.add_option(
-    "-L",
-    "--log-level",
-    default="info",
-    metavar="LEVEL",
-    help="set the log level;"
-    " one of: critical, error, warning, info, debug (default: info)",
-)
 
-parser.add_option(
-    "-c",
-    "--config",
-    default="config.json",
-    metavar="FILE",
-    help="the path to the JSON configuration file (default: config.json)",
-)
+@functools.cache
+def _full_parser() -> "OptionParser":
+    """
+    Builds the full OptionParser. This is only needed for help and error
+    text; the hot path uses the hand-rolled _parse_args instead. Cached
+    so repeated calls within one process (e.g. tests) reuse the parser.
+    """
+    from optparse import OptionParser
 
-discord_group = parser.add_option_group("Discord bot options")
-wuzapi_group = parser.add_option_group("WuzAPI options")
+    parser = OptionParser(
+        usage="%prog [OPTION]...",
+        description=_DESCRIPTION,
+    )
+    # Only computed when optparse actually formats a usage/error line.
+    parser.get_prog_name = _prog_name
+
+    parser.add_option(
+        "-L",
+        "--log-level",
+        default="info",
+        metavar="LEVEL",
+        help="set the log level;"
+        " one of: critical, error, warning, info, debug (default: info)",
+    )
 
-discord_group.add_option(
-    "-t",
-    "--token",
-    dest="discord_token",
-    metavar="TOKEN",
-    help="the bot token (default: taken from WDMTA_DISCORD_TOKEN)",
-)
-discord_group.add_option(
-    "-s",
-    "--sync-to-guild",
-    type=int,
-    metavar="GUILD_ID",
-    help="sync application commands to the guild GUILD_ID upon startup",
-)
-discord_group.add_option(
-    "-a",
-    "--admin",
-    type=int,
-    action="append",
-    metavar="USER_ID",
-    help="allow the user USER_ID to run admin commands, in addition to the bot owner"
-    " (can be given multiple times to specify multiple admins)",
-)
-discord_group.add_option(
-    "--allow-all", action="store_true", help="allow all users to run admin commands"
-)
+    parser.add_option(
+        "-c",
+        "--config",
+        default="config.json",
+        metavar="FILE",
+        help="the path to the JSON configuration file (default: config.json)",
+    )
 
-discord_group.add_option(
-    "--reconnect",
-    dest="reconnect",
-    action="store_true",
-    default=True,
-    help="enable automatic reconnection (default)",
-)
-discord_group.add_option(
-    "--no-reconnect",
-    dest="reconnect",
-    action="store_false",
-    help="disable automatic reconnection",
-)
-discord_group.add_option(
-    "--enable-test-commands",
-    action="store_true",
-    help="enable commands intended for testing purposes",
-)
+    discord_group = parser.add_option_group("Discord bot options")
+    wuzapi_group = parser.add_option_group("WuzAPI options")
 
-wuzapi_group.add_option(
-    "-u",
-    "--url",
-    dest="wuzapi_url",
-    default="http://127.0.0.1:8080",
-    metavar="URL",
-    help="the endpoint URL (default: http://localhost:8080)",
-)
-wuzapi_group.add_option(
-    "-x",
-    dest="wuzapi_token",
-    metavar="TOKEN",
-    help="the user token (default: taken from WDMTA_WUZAPI_TOKEN)",
-)
+    discord_group.add_option(
+        "-t",
+        "--token",
+        dest="discord_token",
+        metavar="TOKEN",
+        help="the bot token (default: taken from WDMTA_DISCORD_TOKEN)",
+    )
+    discord_group.add_option(
+        "-s",
+        "--sync-to-guild",
+        type=int,
+        metavar="GUILD_ID",
+        help="sync application commands to the guild GUILD_ID upon startup",
+    )
+    discord_group.add_option(
+        "-a",
+        "--admin",
+        type=int,
+        action="append",
+        metavar="USER_ID",
+        help="allow the user USER_ID to run admin commands, in addition to the bot owner"
+        " (can be given multiple times to specify multiple admins)",
+    )
+    discord_group.add_option(
+        "--allow-all", action="store_true", help="allow all users to run admin commands"
+    )
 
-wuzapi_group.add_option(
-    "--webhook-host",
-    dest="wuzapi_webhook_host",
-    default="localhost",
-    metavar="HOSTNAME",
-    help="host the webhook on HOSTNAME (default: localhost)",
-)
-wuzapi_group.add_option(
-    "--webhook-port",
-    dest="wuzapi_webhook_port",
-    type=int,
-    default=8000,
-    metavar="NUMBER",
-    help="host the webhook on port NUMBER (default: 8000)",
-)
-wuzapi_group.add_option(
-    "-m",
-    "--media-maxsize",
-    default=10_000_000,
-    metavar="SIZE",
-    help="do not download media files beyond SIZE bytes (default: 10000000)",
-)
-wuzapi_group.add_option(
-    "-l",
-    "--message-limit",
-    default=1000,
-    metavar="NUMBER",
-    help="keep track of no more than NUMBER messages, on a per-chat basis"
-    " (used for handling replies) (default: 1000)",
-)
-wuzapi_group.add_option(
-    "-d",
-    "--dump-file",
-    metavar="FILE",
-    help="append received WuzAPI event data to FILE (for development purposes)",
-)
+    discord_group.add_option(
+        "--reconnect",
+        dest="reconnect",
+        action="store_true",
+        default=True,
+        help="enable automatic reconnection (default)",
+    )
+    discord_group.add_option(
+        "--no-reconnect",
+        dest="reconnect",
+        action="store_false",
+        help="disable automatic reconnection",
+    )
+    discord_group.add_option(
+        "--enable-test-commands",
+        action="store_true",
+        help="enable commands intended for testing purposes",
+    )
+
+    wuzapi_group.add_option(
+        "-u",
+        "--url",
+        dest="wuzapi_url",
+        default="http://127.0.0.1:8080",
+        metavar="URL",
+        help="the endpoint URL (default: http://localhost:8080)",
+    )
+    wuzapi_group.add_option(
+        "-x",
+        dest="wuzapi_token",
+        metavar="TOKEN",
+        help="the user token (default: taken from WDMTA_WUZAPI_TOKEN)",
+    )
+
+    wuzapi_group.add_option(
+        "--webhook-host",
+        dest="wuzapi_webhook_host",
+        default="localhost",
+        metavar="HOSTNAME",
+        help="host the webhook on HOSTNAME (default: localhost)",
+    )
+    wuzapi_group.add_option(
+        "--webhook-port",
+        dest="wuzapi_webhook_port",
+        type=int,
+        default=8000,
+        metavar="NUMBER",
+        help="host the webhook on port NUMBER (default: 8000)",
+    )
+    wuzapi_group.add_option(
+        "-m",
+        "--media-maxsize",
+        type=int,
+        default=10_000_000,
+        metavar="SIZE",
+        help="do not download media files beyond SIZE bytes (default: 10000000)",
+    )
+    wuzapi_group.add_option(
+        "-l",
+        "--message-limit",
+        type=int,
+        default=1000,
+        metavar="NUMBER",
+        help="keep track of no more than NUMBER messages, on a per-chat basis"
+        " (used for handling replies) (default: 1000)",
+    )
+    wuzapi_group.add_option(
+        "-d",
+        "--dump-file",
+        metavar="FILE",
+        help="append received WuzAPI event data to FILE (for development purposes)",
+    )
+
+    return parser
+
+
+def _parse_args(argv: list[str], /) -> SimpleNamespace:
+    """
+    Walks argv against the known flags, deferring to the full OptionParser
+    only when something does not parse cleanly.
+    """
+    opts = SimpleNamespace(**_DEFAULTS)
+
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        i += 1
+
+        if (switch := _SWITCH_FLAGS.get(arg)) is not None:
+            setattr(opts, switch[0], switch[1])
+            continue
+
+        flag, eq, value = arg.partition("=")
+
+        if (spec := _VALUE_FLAGS.get(flag)) is None:
+            # Unknown or unusually-spelled option; let optparse deal with it.
+            return _full_parser().parse_args(argv)[0]
+
+        if not eq:
+            if i >= len(argv):
+                return _full_parser().parse_args(argv)[0]
+
+            value = argv[i]
+            i += 1
+
+        dest, value_type = spec
+
+        if value_type is int:
+            try:
+                value = int(value)
+            except ValueError:
+                return _full_parser().parse_args(argv)[0]
+
+        if dest == "admin":
+            if opts.admin is None:
+                opts.admin = []
+            opts.admin.append(value)
+        else:
+            setattr(opts, dest, value)
+
+    return opts
+
+
+_LOG_LEVELS = {
+    name: getattr(logging, name.upper())
+    for name in ("critical", "error", "warning", "info", "debug")
+}
 
 
 def parse_log_level(log_level: str) -> int:
-    match log_level.casefold():
-        case "critical":
-            return logging.CRITICAL
-        case "error":
-            return logging.ERROR
-        case "warning":
-            return logging.WARNING
-        case "info":
-            return logging.INFO
-        case "debug":
-            return logging.DEBUG
-        case _:
-            parser.error(f"Unknown log level: '{log_level}'")
+    level = _LOG_LEVELS.get(log_level.casefold())
+
+    if level is None:
+        _full_parser().error(f"Unknown log level: '{log_level}'")
+
+    return level
 
 
 def get_token(*, desc: str, env_var_name: str) -> str:
     token = os.environ.get(env_var_name)
 
-    while not token:
-        token = input(f"Enter the {desc} token: ")
+    if not token:
+        # Read once without echoing (keeps the token out of terminal
+        # scrollback and readline history) and fail clearly if empty,
+        # rather than silently re-prompting in a loop.
+        from getpass import getpass
+
+        token = getpass(f"Enter the {desc} token: ")
+
+    if not token:
+        _full_parser().error(f"no {desc} token provided (set {env_var_name})")
 
     return token
 
 
 def main() -> int:
-    opts, _ = parser.parse_args()
+    if any(arg in ("-h", "--help") for arg in sys.argv[1:]):
+        sys.stdout.write(_STATIC_HELP)
+        return 0
+
+    opts = _parse_args(sys.argv[1:])
 
     log_level = parse_log_level(opts.log_level)
 
-    admin_ids: set[int] | None = None
+    # Deferred until after option parsing so that --help and argument
+    # errors do not pay for importing discord.py and the cog graph.
+    from aiohttp import ClientSession, TCPConnector
 
-    if opts.admin:
-        if opts.allow_all:
-            parser.error("--allow-all cannot be specified with -a/--admin")
+    from .cogs.core import CoreCog
+    from .cogs.whatsapp import WhatsAppCog
+    from .discord import WDMTABot
+    from .whatsapp import WhatsAppClient
 
-        admin_ids = set(opts.admin)
-    elif not opts.allow_all:
-        admin_ids = set()
+    if sys.platform != "win32":
+        # The whole bot is webhook server + HTTP client traffic, so the
+        # event loop is on every critical path; uvloop's libuv transports
+        # speed all of it up. Fall back to the stdlib loop where uvloop
+        # is unavailable.
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            import asyncio
+
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+    if opts.admin and opts.allow_all:
+        _full_parser().error("--allow-all cannot be specified with -a/--admin")
+
+    admin_ids: set[int] | None = (
+        set(opts.admin) if opts.admin else (None if opts.allow_all else set())
+    )
 
     try:
         discord_token = opts.discord_token or get_token(
@@ -200,30 +403,50 @@ def main() -> int:
 
     async def setup_bot(bot: WDMTABot):
         whatsapp_client = WhatsAppClient(
-            session=ClientSession(opts.wuzapi_url.rstrip("/") + "/"),
+            session=ClientSession(
+                opts.wuzapi_url.rstrip("/") + "/",
+                # Everything goes to the one WuzAPI host, so raise the
+                # per-host cap and keep idle connections around longer
+                # than the default so bursty forwarding reuses them
+                # instead of re-handshaking.
+                connector=TCPConnector(
+                    limit=256,
+                    limit_per_host=64,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75,
+                    enable_cleanup_closed=True,
+                ),
+            ),
             token=wuzapi_token,
             webhook_host=opts.wuzapi_webhook_host,
             webhook_port=opts.wuzapi_webhook_port,
             dump_file_path=(None if opts.dump_file is None else Path(opts.dump_file)),
         )
 
-        await bot.add_cog(
-            WhatsAppCog(
-                bot,
-                whatsapp_client,
-                config_path=Path(opts.config),
-                media_max_size=opts.media_maxsize,
-                message_cache_size=opts.message_limit,
-            )
-        )
+        # Set up the client before registering the cog; a cog holding a
+        # dead client (and its closed session) is of no use to anyone.
+        request_error = WhatsAppClient.RequestError
 
         try:
             await whatsapp_client.setup()
-        except WhatsAppClient.RequestError:
+        except request_error:
             await whatsapp_client.session.close()
+        else:
+            await bot.add_cog(
+                WhatsAppCog(
+                    bot,
+                    whatsapp_client,
+                    config_path=Path(opts.config),
+                    media_max_size=opts.media_maxsize,
+                    message_cache_size=opts.message_limit,
+                )
+            )
 
         await bot.add_cog(CoreCog(bot))
         if opts.enable_test_commands:
+            # Production startups never pay for importing the test cog.
+            from .cogs.test import TestCog
+
             await bot.add_cog(TestCog(bot))
 
     async def cleanup_bot(bot: WDMTABot) -> None:
@@ -3,29 +3,36 @@ from datetime import UTC, datetime, timedelta
 
 import discord
 from discord.ext import commands
-from typeguard import typechecked
-
+from .._typecheck import typechecked
 from ..discord import InfoEmbed, WDMTABot
 
 logger = logging.getLogger(__name__)
 
+# Bound once so command callbacks get the current time with a single
+# LOAD_GLOBAL instead of an attribute lookup chain.
+_now = datetime.now
+
+# Static embed skeleton; cloned per invocation instead of re-running
+# the Embed initializer.
+_UPTIME_TEMPLATE = InfoEmbed(title="Uptime")
+
 
 @typechecked
 def format_timedelta(delta: timedelta) -> str:
-    days, rem = divmod(delta.total_seconds(), 86_400)
+    days, rem = divmod(int(delta.total_seconds()), 86_400)
     hours, rem = divmod(rem, 3600)
     mins, rem = divmod(rem, 60)
 
     if days > 0:
-        return f"{days:.0f} d {hours:.0f} h {mins:.0f} min {rem:.0f} s"
+        return f"{days} d {hours} h {mins} min {rem} s"
 
     if hours > 0:
-        return f"{hours:.0f} h {mins:.0f} min {rem:.0f} s"
+        return f"{hours} h {mins} min {rem} s"
 
     if mins > 0:
-        return f"{mins:.0f} min {rem:.0f} s"
+        return f"{mins} min {rem} s"
 
-    return f"{rem:.0f} s"
+    return f"{rem} s"
 
 
 @typechecked
@@ -33,16 +40,16 @@ class CoreCog(commands.Cog):
     def __init__(self, bot: WDMTABot, /):
         self.bot = bot
 
-        self._start_time = datetime.now(UTC)
+        self._start_time = _now(UTC)
 
     @discord.app_commands.command(name="ping", description="Displays the bot's ping.")
     async def _ping(self, interaction: discord.Interaction):
-        now = datetime.now(UTC)
+        now = _now(UTC)
 
         await interaction.response.send_message(
             embed=InfoEmbed(
                 title="Pong!",
-                description=f"{(now - interaction.created_at).total_seconds() * 1000:.0f} ms",
+                description=f"{int((now - interaction.created_at).total_seconds() * 1000)} ms",
             )
         )
 
@@ -51,10 +58,10 @@ class CoreCog(commands.Cog):
     )
     async def _uptime(self, interaction: discord.Interaction):
         await interaction.response.send_message(
-            embed=InfoEmbed(title="Uptime")
+            embed=_UPTIME_TEMPLATE.copy()
             .add_field(
                 name="Duration",
-                value=format_timedelta(datetime.now(UTC) - self._start_time),
+                value=format_timedelta(_now(UTC) - self._start_time),
             )
             .add_field(
                 name="Start time", value=f"<t:{self._start_time.timestamp():.0f}>"
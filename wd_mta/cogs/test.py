@@ -2,12 +2,23 @@ import logging
 
 import discord
 from discord.ext import commands
-from typeguard import typechecked
-
+from .._typecheck import typechecked
 from ..discord import ActionEmbed, ErrorEmbed, InfoEmbed, Paginator, WDMTABot
 
 logger = logging.getLogger(__name__)
 
+# Built once; /test embeds sends shallow copies instead of re-running
+# three Embed initializers per invocation.
+_INFO_EMBED = InfoEmbed(description="Information embed.")
+_ERROR_EMBED = ErrorEmbed(description="Error embed.")
+_ACTION_EMBED = ActionEmbed(description="Action embed.")
+
+# Deterministic demo page list; built once instead of per /test pages call.
+_TEST_PAGES = [
+    (Paginator.ListHeading(f"heading {i // 10}") if i % 10 == 0 else f"item {i}")
+    for i in range(50)
+]
+
 
 @typechecked
 class TestCog(commands.GroupCog, group_name="test"):
@@ -18,22 +29,12 @@ class TestCog(commands.GroupCog, group_name="test"):
     async def _embeds(self, interaction: discord.Interaction):
         await interaction.response.send_message(
             embeds=[
-                InfoEmbed(description="Information embed."),
-                ErrorEmbed(description="Error embed."),
-                ActionEmbed(description="Action embed."),
+                _INFO_EMBED.copy(),
+                _ERROR_EMBED.copy(),
+                _ACTION_EMBED.copy(),
             ]
         )
 
     @discord.app_commands.command(name="pages", description="Shows a pagination view.")
     async def _pages(self, interaction: discord.Interaction):
-        await Paginator(
-            interaction,
-            [
-                (
-                    Paginator.ListHeading(f"heading {i // 10}")
-                    if i % 10 == 0
-                    else f"item {i}"
-                )
-                for i in range(50)
-            ],
-        ).start()
+        await Paginator(interaction, _TEST_PAGES).start()
@@ -1,25 +1,48 @@
 from __future__ import annotations
 
-import functools
+import asyncio
+import io
 import json
 import logging
+import os
+import time
 from collections import OrderedDict
-from dataclasses import asdict, dataclass, field
+from collections.abc import Callable
 from pathlib import Path
 from tempfile import NamedTemporaryFile
-from typing import Any, Literal, TypedDict
+from typing import Any, Coroutine, Literal, TypedDict
 
 import discord
 from discord.ext import commands
-from typeguard import check_type, typechecked
 
 from .. import whatsapp
+from .._typecheck import typechecked
 from ..discord import ActionEmbed, ErrorEmbed, InfoEmbed, Paginator, WDMTABot
 
 logger = logging.getLogger(__name__)
 
-
-class SavedBindingConfiguration(TypedDict, total=False):
+# First letter of the forwarding-direction choice
+# -> (discord_to_whatsapp, whatsapp_to_discord).
+_DIRECTIONS = {
+    "D": (True, False),
+    "W": (False, True),
+    "B": (True, True),
+}
+
+# (discord_to_whatsapp, whatsapp_to_discord) -> arrow shown by
+# /binding list; precomputed so listing does no per-entry conditionals.
+_DIRECTION_ARROWS = {
+    (False, False): "-",
+    (True, False): "<-",
+    (False, True): "->",
+    (True, True): "<->",
+}
+
+
+# The live binding state and the on-disk JSON share one representation,
+# so saving serializes the working structures directly with no
+# dataclass-to-dict conversion pass.
+class BindingConfiguration(TypedDict, total=False):
     discord_to_whatsapp: bool
     whatsapp_to_discord: bool
 
@@ -27,21 +50,42 @@ class SavedBindingConfiguration(TypedDict, total=False):
 class SavedConfiguration(TypedDict, total=False):
     bindings_paused: bool
     # Channel ID is stored as str instead of int due to JSON constraints.
-    bindings: dict[str, dict[str, SavedBindingConfiguration]]
+    bindings: dict[str, dict[str, BindingConfiguration]]
 
 
-@dataclass(kw_only=True, slots=True)
-class ActiveBindingConfiguration:
-    discord_to_whatsapp: bool = False
-    whatsapp_to_discord: bool = False
+def _validate_saved_config(config: Any, /) -> SavedConfiguration:
+    """
+    Validates the structure of a loaded configuration in a single pass.
+    Much cheaper than walking the nested TypedDicts reflectively with
+    typeguard, and only needed on load; everything written back out was
+    either loaded through here or built by the binding commands.
+    """
+    if not isinstance(config, dict):
+        raise TypeError("configuration must be a JSON object")
 
+    if not isinstance(config.get("bindings_paused", False), bool):
+        raise TypeError("'bindings_paused' must be a boolean")
 
-@dataclass(kw_only=True, slots=True)
-class ActiveConfiguration:
-    bindings_paused: bool = False
-    bindings: dict[str, dict[str, ActiveBindingConfiguration]] = field(
-        default_factory=dict
-    )
+    bindings = config.get("bindings", {})
+    if not isinstance(bindings, dict):
+        raise TypeError("'bindings' must be a JSON object")
+
+    for chat_id, chat_bindings in bindings.items():
+        if not isinstance(chat_bindings, dict):
+            raise TypeError(f"bindings for chat '{chat_id}' must be a JSON object")
+
+        for channel_id, binding in chat_bindings.items():
+            if not isinstance(binding, dict):
+                raise TypeError(f"binding for channel '{channel_id}' must be a JSON object")
+
+            for key, value in binding.items():
+                if key not in ("discord_to_whatsapp", "whatsapp_to_discord"):
+                    raise TypeError(f"unknown binding key: '{key}'")
+
+                if not isinstance(value, bool):
+                    raise TypeError(f"binding key '{key}' must be a boolean")
+
+    return config
 
 
 class _MessageForwardingParams(TypedDict):
@@ -50,10 +94,21 @@ class _MessageForwardingParams(TypedDict):
     file: discord.File | None
     message_id: str
     reference_id: str | None
+    # Markdown-escaped message text, computed once per message rather
+    # than once per bound channel.
+    escaped_text: str | None
 
 
 @typechecked
 class WhatsAppCog(commands.Cog):
+    # How long to coalesce configuration mutations before writing them out.
+    _SAVE_DELAY = 1.0
+
+    # How long a fetched avatar URL stays valid, and how many senders to
+    # remember; bursty chats then cost zero avatar round-trips.
+    _AVATAR_TTL = 300.0
+    _AVATAR_CACHE_SIZE = 1024
+
     def __init__(
         self,
         bot: WDMTABot,
@@ -69,47 +124,211 @@ class WhatsAppCog(commands.Cog):
         self.media_maxsize = media_max_size
         self.message_cache_size = message_cache_size
 
-        self._config: ActiveConfiguration
+        self._bindings_paused: bool
+        # Channel IDs are kept as ints in the live state; they are only
+        # stringified at the JSON boundary in _load_config/_save_config.
+        # Chat IDs stay as strings, being WhatsApp JIDs.
+        self._bindings: dict[str, dict[int, BindingConfiguration]]
+        # Reverse index over the bindings, so channel-keyed lookups
+        # (/binding remove) need not scan every chat. A channel bound to
+        # several chats keeps only one entry here; _pop_binding falls
+        # back to a scan when the index misses.
+        self._channel_to_chat: dict[int, str]
         self._load_config()
 
+        self._save_handle: asyncio.TimerHandle | None = None
+        # The executor future of a flush currently writing to disk.
+        self._save_future: asyncio.Future[None] | None = None
+
         whatsapp_client.on_message = self._process_whatsapp_message
 
-        self._whatsapp_to_discord_messages: dict[
-            str, OrderedDict[int, discord.Message]
-        ] = {}
+        # Bound channels already resolved and validated, keyed by channel
+        # ID; filled lazily since discord.py's channel cache is not
+        # populated at cog-load time.
+        self._resolved_channels: dict[int, discord.TextChannel] = {}
+
+        # Maps (WhatsApp message ID, channel ID) to the forwarded Discord
+        # message, bounded globally at message_cache_size entries with
+        # oldest-first eviction.
+        self._whatsapp_to_discord_messages: OrderedDict[
+            tuple[str, int], discord.Message
+        ] = OrderedDict()
+
+        # Maps sender ID to (fetch time, avatar URL), bounded at
+        # _AVATAR_CACHE_SIZE entries with oldest-first eviction.
+        self._avatar_cache: OrderedDict[str, tuple[float, str | None]] = OrderedDict()
+
+        # Direct type-to-handler dispatch: there are only a handful of
+        # concrete MessageContent subclasses, so a dict lookup on
+        # type(content) beats singledispatch's MRO walk per message.
+        self._content_handlers: dict[
+            type[whatsapp.MessageContent],
+            Callable[[whatsapp.MessageContent, _MessageForwardingParams], Coroutine],
+        ] = {
+            whatsapp.UnknownMessageContent: self._handle_unknown,
+            whatsapp.ReactionMessageContent: self._handle_reaction,
+            whatsapp.ConversationTextMessageContent: self._handle_text,
+            whatsapp.ExtendedTextMessageContent: self._handle_text,
+            whatsapp.MediaMessageContent: self._handle_media,
+        }
 
     def _load_config(self, /) -> None:
         if not self.config_path.exists():
             logger.info("Creating empty configuration")
-            self._config = ActiveConfiguration()
+            self._bindings_paused = False
+            self._bindings = {}
+            self._channel_to_chat = {}
             return
 
         logger.info("Loading configuration from disk")
         with self.config_path.open("r") as f:
-            config = check_type(json.load(f), SavedConfiguration)
-            bindings: dict[str, dict[str, SavedBindingConfiguration]] = config.get(
-                "bindings", {}
-            )
+            config = _validate_saved_config(json.load(f))
+
+        self._bindings_paused = config.get("bindings_paused", False)
+        self._bindings = {
+            chat_id: {
+                int(channel_id): binding for channel_id, binding in chat_bindings.items()
+            }
+            for chat_id, chat_bindings in config.get("bindings", {}).items()
+        }
+        self._channel_to_chat = {
+            channel_id: chat_id
+            for chat_id, chat_bindings in self._bindings.items()
+            for channel_id in chat_bindings
+        }
+
+    def _pop_binding(self, channel_id: int, /) -> str | None:
+        """
+        Removes the binding for the given channel and returns the chat ID
+        it belonged to, or None if the channel is not bound anywhere.
+        Uses the reverse index as a fast path, falling back to a scan so
+        a channel bound to several chats can be unbound one at a time.
+        """
+        chat_id = self._channel_to_chat.pop(channel_id, None)
+
+        if chat_id is None or channel_id not in (
+            chat_bindings := self._bindings.get(chat_id, {})
+        ):
+            for chat_id, chat_bindings in self._bindings.items():
+                if channel_id in chat_bindings:
+                    break
+            else:
+                return None
+
+        del chat_bindings[channel_id]
+        if not chat_bindings:
+            del self._bindings[chat_id]
+
+        return chat_id
 
-            self._config = ActiveConfiguration(
-                **(
-                    {"bindings_paused": bindings_paused}
-                    if (bindings_paused := config.get("bindings_paused"))
-                    else {}
-                ),
+    def _serialize_config(self, /) -> bytes:
+        # Must run on the event loop: it iterates the live binding dicts,
+        # which the command handlers mutate from the same loop. Handing
+        # this to a thread would race those mutations.
+        return json.dumps(
+            SavedConfiguration(
+                bindings_paused=self._bindings_paused,
                 bindings={
                     chat_id: {
-                        channel_id: ActiveBindingConfiguration(**config)
-                        for channel_id, config in chat_bindings.items()
+                        str(channel_id): binding
+                        for channel_id, binding in chat_bindings.items()
                     }
-                    for chat_id, chat_bindings in bindings.items()
+                    for chat_id, chat_bindings in self._bindings.items()
                 },
             )
+        ).encode()
 
-    def _save_config(self, /) -> None:
+    def _write_config(self, payload: bytes, /) -> None:
         logger.info("Saving configuration to disk")
-        with self.config_path.open("w") as f:
-            json.dump(check_type(asdict(self._config), SavedConfiguration), f)
+
+        # Write to a sibling temp file and move it into place, so that a
+        # crash mid-write cannot leave behind a truncated configuration.
+        with NamedTemporaryFile("wb", dir=self.config_path.parent, delete=False) as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(f.name, self.config_path)
+
+    def _mark_dirty(self, /) -> None:
+        """
+        Schedules a debounced write-out of the configuration, so bursts
+        of binding mutations coalesce into a single disk write.
+        """
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+
+        self._save_handle = asyncio.get_running_loop().call_later(
+            self._SAVE_DELAY, self._flush_config
+        )
+
+    def _flush_config(self, /) -> None:
+        self._save_handle = None
+        # Serialization snapshots the bindings here on the event loop;
+        # only the disk write (and its fsync) goes to the executor, so
+        # message forwarding does not stall behind it.
+        payload = self._serialize_config()
+        self._save_future = asyncio.get_running_loop().run_in_executor(
+            None, self._write_config, payload
+        )
+        self._save_future.add_done_callback(self._save_done)
+
+    def _save_done(self, future: asyncio.Future[None], /) -> None:
+        if self._save_future is future:
+            self._save_future = None
+
+        if not future.cancelled() and (exc := future.exception()) is not None:
+            logger.error("Configuration save failed", exc_info=exc)
+
+    async def cog_unload(self) -> None:
+        # Wait out a flush that already reached the executor, so its
+        # write cannot land after (and clobber) the final one below.
+        # Failures are already logged by the done-callback.
+        if self._save_future is not None:
+            await asyncio.wait([self._save_future])
+
+        # Flush any still-pending configuration write before going away.
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+            self._save_handle = None
+            await asyncio.to_thread(self._write_config, self._serialize_config())
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(
+        self, channel: discord.abc.GuildChannel, /
+    ) -> None:
+        self._resolved_channels.pop(channel.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(
+        self,
+        before: discord.abc.GuildChannel,
+        after: discord.abc.GuildChannel,
+        /,
+    ) -> None:
+        # Re-resolve on the next message in case the channel type changed.
+        del after
+        self._resolved_channels.pop(before.id, None)
+
+    async def _get_avatar_url(self, sender_id: str, /) -> str | None:
+        cached = self._avatar_cache.get(sender_id)
+        if cached is not None and time.monotonic() - cached[0] < self._AVATAR_TTL:
+            return cached[1]
+
+        avatar_url: str | None = None
+        try:
+            avatar_url = await self.whatsapp_client.get_user_avatar(
+                sender_id,
+                preview=True,
+            )
+        except whatsapp.WhatsAppClient.RequestError:
+            pass
+
+        self._avatar_cache[sender_id] = (time.monotonic(), avatar_url)
+        if len(self._avatar_cache) > self._AVATAR_CACHE_SIZE:
+            self._avatar_cache.popitem(last=False)
+
+        return avatar_url
 
     def _format_quote(self, quote: whatsapp.MessageContent, /) -> str:
         quote_str: str
@@ -135,8 +354,8 @@ class WhatsAppCog(commands.Cog):
 
         if params["reference_id"] is not None:
             reference = self._whatsapp_to_discord_messages.get(
-                params["reference_id"], {}
-            ).get(channel.id)
+                (params["reference_id"], channel.id)
+            )
 
             if reference is None:
                 params["embeds"].append(
@@ -147,59 +366,69 @@ class WhatsAppCog(commands.Cog):
             else:
                 send_kwargs["reference"] = reference
 
-        store = self._whatsapp_to_discord_messages.get(params["message_id"])
-        if store is None:
-            store = self._whatsapp_to_discord_messages[params["message_id"]] = (
-                OrderedDict()
-            )
-
-        store[channel.id] = await channel.send(embeds=params["embeds"], **send_kwargs)
+        self._whatsapp_to_discord_messages[(params["message_id"], channel.id)] = (
+            await channel.send(embeds=params["embeds"], **send_kwargs)
+        )
 
-        if len(store) > self.message_cache_size:
-            store.popitem(last=False)
+        if len(self._whatsapp_to_discord_messages) > self.message_cache_size:
+            self._whatsapp_to_discord_messages.popitem(last=False)
 
     async def _process_whatsapp_message(self, message: whatsapp.Message, /) -> None:
-        if self._config.bindings_paused:
+        if self._bindings_paused:
             return
 
-        if not (chat_bindings := self._config.bindings.get(message.chat_id)):
+        if not (chat_bindings := self._bindings.get(message.chat_id)):
             return
 
-        initial_embeds = [discord.Embed(timestamp=message.timestamp)]
-        initial_embeds[0].set_footer(text="forwarded from WhatsApp")
+        # A chat bound only Discord-to-WhatsApp has nothing to forward;
+        # bail before spending the avatar fetch and embed allocations.
+        if not any(
+            config.get("whatsapp_to_discord") for config in chat_bindings.values()
+        ):
+            return
 
-        avatar_url: str | None = None
-        try:
-            avatar_url = await self.whatsapp_client.get_user_avatar(
-                message.sender_id,
-                preview=True,
-            )
-        except whatsapp.WhatsAppClient.RequestError:
-            pass
+        # Kick the avatar fetch off in the background; its HTTP round
+        # trip overlaps with the embed construction and channel
+        # resolution below, and the URL is not needed until the author
+        # fields are filled in just before sending.
+        avatar_task = asyncio.create_task(self._get_avatar_url(message.sender_id))
 
-        initial_embeds[0].set_author(
-            name=message.push_name,
-            icon_url=avatar_url,
-        )
+        initial_embeds = [discord.Embed(timestamp=message.timestamp)]
+        initial_embeds[0].set_footer(text="forwarded from WhatsApp")
 
         if message.content.quote is not None:
             initial_embeds.insert(
                 0, discord.Embed(description=self._format_quote(message.content.quote))
             )
 
+        escaped_text = (
+            discord.utils.escape_markdown(message.content.text)
+            if isinstance(message.content, whatsapp.TextMessageContent)
+            else None
+        )
+
+        # Validate the bound channels synchronously first, then fire all
+        # per-channel sends concurrently; delivery latency is bounded by
+        # the slowest Discord REST call rather than their sum.
+        forwards: list[_MessageForwardingParams] = []
+        dead_channels: list[int] = []
+
         for channel_id, config in chat_bindings.items():
-            if not config.whatsapp_to_discord:
+            if not config.get("whatsapp_to_discord"):
                 continue
 
-            if (channel := self.bot.get_channel(int(channel_id))) is None:
-                logger.warning("Bound channel is nonexistent")
-                del chat_bindings[channel_id]
-                continue
+            if (channel := self._resolved_channels.get(channel_id)) is None:
+                if (channel := self.bot.get_channel(channel_id)) is None:
+                    logger.warning("Bound channel is nonexistent")
+                    dead_channels.append(channel_id)
+                    continue
 
-            if not isinstance(channel, discord.TextChannel):
-                logger.warning("Bound channel is not a TextChannel: %s", channel)
-                del chat_bindings[channel_id]
-                continue
+                if not isinstance(channel, discord.TextChannel):
+                    logger.warning("Bound channel is not a TextChannel: %s", channel)
+                    dead_channels.append(channel_id)
+                    continue
+
+                self._resolved_channels[channel_id] = channel
 
             logger.info(
                 "Forwarding WhatsApp message from %s to channel %s",
@@ -207,35 +436,62 @@ class WhatsAppCog(commands.Cog):
                 channel,
             )
 
-            await self._handle_message_content(
-                message.content,
+            forwards.append(
                 _MessageForwardingParams(
                     channel=channel,
-                    embeds=initial_embeds,
+                    # Each channel gets its own Embed copies: the content
+                    # handlers mutate embeds in place, and sharing them
+                    # would leak one channel's edits (and appended error
+                    # embeds) into every other channel's payload.
+                    embeds=[
+                        discord.Embed.from_dict(embed.to_dict())
+                        for embed in initial_embeds
+                    ],
                     file=None,
                     message_id=message.id,
                     reference_id=None,
-                ),
+                    escaped_text=escaped_text,
+                )
             )
 
-    @functools.singledispatchmethod
-    async def _handle_message_content(
+        for channel_id in dead_channels:
+            del chat_bindings[channel_id]
+            self._channel_to_chat.pop(channel_id, None)
+
+        avatar_url = await avatar_task
+
+        for params in forwards:
+            params["embeds"][-1].set_author(
+                name=message.push_name,
+                icon_url=avatar_url,
+            )
+
+        handler = self._content_handlers.get(
+            type(message.content), self._handle_unsupported
+        )
+
+        for result in await asyncio.gather(
+            *(handler(message.content, params) for params in forwards),
+            return_exceptions=True,
+        ):
+            if isinstance(result, Exception):
+                logger.exception("Message forwarding failed", exc_info=result)
+
+    async def _handle_unsupported(
         self, content: whatsapp.MessageContent, params: _MessageForwardingParams
     ):
         del content
         params["embeds"][0].description = "`< unsupported message content type >`"
         await self._send_forwarded_message_to_channel(params)
 
-    @_handle_message_content.register
-    async def _(
+    async def _handle_unknown(
         self,
-        content: whatsapp.UnknownMessageContent,
+        content: whatsapp.MessageContent,
         params: _MessageForwardingParams,
     ):
         del content, params
 
-    @_handle_message_content.register
-    async def _(
+    async def _handle_reaction(
         self,
         content: whatsapp.ReactionMessageContent,
         params: _MessageForwardingParams,
@@ -250,17 +506,16 @@ class WhatsAppCog(commands.Cog):
 
         await self._send_forwarded_message_to_channel(params)
 
-    @_handle_message_content.register
-    async def _(
+    async def _handle_text(
         self,
         content: whatsapp.TextMessageContent,
         params: _MessageForwardingParams,
     ):
-        params["embeds"][-1].description = discord.utils.escape_markdown(content.text)
+        del content
+        params["embeds"][-1].description = params["escaped_text"]
         await self._send_forwarded_message_to_channel(params)
 
-    @_handle_message_content.register
-    async def _(
+    async def _handle_media(
         self,
         content: whatsapp.MediaMessageContent,
         params: _MessageForwardingParams,
@@ -283,15 +538,15 @@ class WhatsAppCog(commands.Cog):
             params["embeds"].append(ErrorEmbed(description="Failed to download media."))
             await self._send_forwarded_message_to_channel(params)
         else:
-            with NamedTemporaryFile(
-                "w+b", suffix="." + content.mimetype.split("/", 1)[1]
-            ) as f:
-                logger.info("Writing %d B of data to temporary file", len(data))
-                f.write(data)
-                f.flush()
-
-                params["file"] = discord.File(f.name)
-                await self._send_forwarded_message_to_channel(params)
+            # The data is already fully in memory (WuzAPI delivers media
+            # as base64 inside a JSON body), so hand it to discord.File
+            # directly rather than round-tripping it through a temp file.
+            logger.info("Attaching %d B of media data", len(data))
+            params["file"] = discord.File(
+                io.BytesIO(data),
+                filename=f"media.{content.mimetype.split('/', 1)[1]}",
+            )
+            await self._send_forwarded_message_to_channel(params)
 
     _session_group = discord.app_commands.Group(
         name="session", description="WhatsApp session management."
@@ -348,7 +603,7 @@ class WhatsAppCog(commands.Cog):
         await interaction.response.defer()
 
         async for user in self.whatsapp_client.get_users(
-            list(map("{}@s.whatsapp.net".format, map(str.strip, phones.split(","))))
+            [f"{phone.strip()}@s.whatsapp.net" for phone in phones.split(",")]
         ):
             embed = InfoEmbed(title="User Information")
             embed.add_field(
@@ -402,16 +657,16 @@ class WhatsAppCog(commands.Cog):
         if name_contains:
             name_contains = name_contains.casefold()
 
-        filtered_groups: list[str] = []
-
-        async for group in self.whatsapp_client.get_groups():
-            if name_contains and name_contains not in group.name.casefold():
-                continue
-
-            if is_announce is not None and group.is_announce != is_announce:
-                continue
-
-            filtered_groups.append(group.name)
+        # get_groups is backed by one bulk WuzAPI call, so every group is
+        # already in hand by the time the first one is yielded; the full
+        # list is built eagerly since streaming it into the paginator
+        # would not make the first page render any sooner.
+        filtered_groups = [
+            group.name
+            async for group in self.whatsapp_client.get_groups()
+            if not (name_contains and name_contains not in group.name.casefold())
+            and not (is_announce is not None and group.is_announce != is_announce)
+        ]
 
         await Paginator(interaction, filtered_groups).start()
 
@@ -471,7 +726,7 @@ class WhatsAppCog(commands.Cog):
             )
             return
 
-        if not self._config.bindings:
+        if not self._bindings:
             await interaction.response.send_message(
                 embed=InfoEmbed(description="No bindings have been configured.")
             )
@@ -481,21 +736,28 @@ class WhatsAppCog(commands.Cog):
 
         result: list[str | Paginator.ListHeading] = []
 
-        for chat_id, chat_bindings in self._config.bindings.items():
-            result.append(
-                Paginator.ListHeading(
-                    await self.whatsapp_client.get_group_name_from_jid(chat_id)
-                )
+        # Resolve all the group names concurrently up front; done inline,
+        # each bound chat would cost one serialized WuzAPI round trip.
+        group_names = await asyncio.gather(
+            *(
+                self.whatsapp_client.get_group_name_from_jid(chat_id)
+                for chat_id in self._bindings
             )
+        )
+
+        for (chat_id, chat_bindings), group_name in zip(
+            self._bindings.items(), group_names
+        ):
+            result.append(Paginator.ListHeading(group_name))
 
             for channel_id, config in chat_bindings.items():
-                result.append(
-                    f"<#{channel_id}> (W {
-                    "<" if config.discord_to_whatsapp else ""
-                    }-{
-                    ">" if config.whatsapp_to_discord else ""
-                    } D)"
-                )
+                arrow = _DIRECTION_ARROWS[
+                    (
+                        bool(config.get("discord_to_whatsapp")),
+                        bool(config.get("whatsapp_to_discord")),
+                    )
+                ]
+                result.append(f"<#{channel_id}> (W {arrow} D)")
 
         await Paginator(interaction, result).start()
 
@@ -535,17 +797,19 @@ class WhatsAppCog(commands.Cog):
             assert interaction.guild
             channel = await interaction.guild.create_text_channel(group.name)
 
-        chat_bindings = self._config.bindings.get(group.jid, {})
+        chat_bindings = self._bindings.get(group.jid, {})
         if not chat_bindings:
-            self._config.bindings[group.jid] = chat_bindings
+            self._bindings[group.jid] = chat_bindings
 
-        config = chat_bindings.get(str(channel.id))
+        config = chat_bindings.get(channel.id)
         updating = True
         if config is None:
-            config = chat_bindings[str(channel.id)] = ActiveBindingConfiguration(
-                discord_to_whatsapp=direction[0] in set("DB"),
-                whatsapp_to_discord=direction[0] in set("WB"),
+            discord_to_whatsapp, whatsapp_to_discord = _DIRECTIONS[direction[0]]
+            config = chat_bindings[channel.id] = BindingConfiguration(
+                discord_to_whatsapp=discord_to_whatsapp,
+                whatsapp_to_discord=whatsapp_to_discord,
             )
+            self._channel_to_chat[channel.id] = group.jid
             updating = False
 
         await interaction.followup.send(
@@ -561,7 +825,7 @@ class WhatsAppCog(commands.Cog):
             .add_field(name="Forwarding direction", value=direction)
         )
 
-        self._save_config()
+        self._mark_dirty()
 
     @_binding_group.command(
         name="remove",
@@ -582,19 +846,13 @@ class WhatsAppCog(commands.Cog):
 
         await interaction.response.defer()
 
-        if not self._config.bindings:
+        if not self._bindings:
             await interaction.followup.send(
                 embed=InfoEmbed(description="No bindings are currently configured.")
             )
             return
 
-        for chat_id, chat_bindings in self._config.bindings.items():
-            if str(channel.id) in chat_bindings:
-                del chat_bindings[str(channel.id)]
-                if not chat_bindings:
-                    del self._config.bindings[chat_id]
-                break
-        else:
+        if self._pop_binding(channel.id) is None:
             await interaction.followup.send(
                 embed=InfoEmbed(
                     description="No binding is configured for the given channel."
@@ -610,7 +868,7 @@ class WhatsAppCog(commands.Cog):
                 embed=InfoEmbed(description="Binding successfully deleted.")
             )
 
-        self._save_config()
+        self._mark_dirty()
 
     @_binding_group.command(
         name="clear", description="Removes all configured bindings."
@@ -628,7 +886,7 @@ class WhatsAppCog(commands.Cog):
         if not self.bot.is_admin(interaction.user):
             raise commands.NotOwner()
 
-        if not self._config.bindings:
+        if not self._bindings:
             await interaction.response.send_message(
                 embed=InfoEmbed(description="There are no bindings to clear.")
             )
@@ -641,14 +899,14 @@ class WhatsAppCog(commands.Cog):
         failed_count = 0
         missing_count = 0
 
-        for chat_id, chat_bindings in self._config.bindings.items():
-            to_clear: set[str] = set()
+        for chat_id, chat_bindings in self._bindings.items():
+            to_clear: set[int] = set()
 
             for channel_id in chat_bindings:
                 channel = (
-                    self.bot.get_channel(int(channel_id))
+                    self.bot.get_channel(channel_id)
                     if include_global
-                    else interaction.guild.get_channel(int(channel_id))
+                    else interaction.guild.get_channel(channel_id)
                 )
 
                 if isinstance(channel, discord.TextChannel):
@@ -667,10 +925,15 @@ class WhatsAppCog(commands.Cog):
 
             for channel_id in to_clear:
                 del chat_bindings[channel_id]
+                self._channel_to_chat.pop(channel_id, None)
 
-        for chat_id in set(self._config.bindings.keys()):
-            if not self._config.bindings[chat_id]:
-                del self._config.bindings[chat_id]
+        # Rebuild without the emptied chats instead of deleting keys from
+        # a dict being iterated over a snapshot of itself.
+        self._bindings = {
+            chat_id: chat_bindings
+            for chat_id, chat_bindings in self._bindings.items()
+            if chat_bindings
+        }
 
         embeds = [
             InfoEmbed(
@@ -696,20 +959,20 @@ class WhatsAppCog(commands.Cog):
 
         await interaction.followup.send(embeds=embeds)
 
-        self._save_config()
+        self._mark_dirty()
 
     @_binding_group.command(name="pause", description="Suspends all bindings globally.")
     async def _binding_pause(self, interaction: discord.Interaction):
         if not self.bot.is_admin(interaction.user):
             raise commands.NotOwner()
 
-        if self._config.bindings_paused:
+        if self._bindings_paused:
             await interaction.response.send_message(
                 embed=InfoEmbed(description="Bindings are already paused.")
             )
             return
 
-        self._config.bindings_paused = True
+        self._bindings_paused = True
         await interaction.response.send_message(
             embed=InfoEmbed(
                 title="Bindings Paused",
@@ -724,13 +987,13 @@ class WhatsAppCog(commands.Cog):
         if not self.bot.is_admin(interaction.user):
             raise commands.NotOwner()
 
-        if not self._config.bindings_paused:
+        if not self._bindings_paused:
             await interaction.response.send_message(
                 embed=InfoEmbed(description="Bindings have not already been paused.")
             )
             return
 
-        self._config.bindings_paused = True
+        self._bindings_paused = True
         await interaction.response.send_message(
             embed=InfoEmbed(
                 title="Bindings Resumed",
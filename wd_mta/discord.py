@@ -10,7 +10,8 @@ from typing import Coroutine, Self
 from discord import Color, Embed, Intents, Interaction, Object, app_commands, ui
 from discord.abc import User
 from discord.ext import commands
-from typeguard import typechecked
+
+from ._typecheck import typechecked
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +19,17 @@ ActionEmbed = functools.partial(Embed, color=Color.from_rgb(255, 255, 100))
 InfoEmbed = functools.partial(Embed, color=Color.from_rgb(150, 130, 255))
 ErrorEmbed = functools.partial(Embed, title="Error", color=Color.from_rgb(255, 30, 50))
 
+# Fixed error responses, built once instead of per failed interaction;
+# they are sent as-is and never mutated.
+_NOT_OWNER_EMBED = ErrorEmbed(
+    description="(╯°□°)╯︵ ┻━┻ You do not have permission to run this command!"
+)
+_GENERIC_ERROR_EMBED = ErrorEmbed(
+    description=r"(´･_･\`) An error occurred while running the command."
+    "\nThis is probably due to a bug."
+).set_footer(text="Developers: check the logs for details.")
+_NOT_FOR_YOU_EMBED = ErrorEmbed(description="(►__◄) This button is not for you!")
+
 
 @typechecked
 class WDMTABot(commands.Bot):
@@ -50,20 +62,27 @@ class WDMTABot(commands.Bot):
             # Sync the commands to the specific guild.
             # This is mainly intended for development purposes.
 
-            if logger.isEnabledFor(logging.INFO):
-                logger.info(
-                    "Syncing %d commands: %s",
-                    len(cmds := self.tree.get_commands()),
-                    ", ".join(cmd.name for cmd in cmds),
-                )
-
-            guild = Object(id=self.sync_guild_id)
-            self.tree.copy_global_to(guild=guild)
-            await self.tree.sync(guild=guild)
+            if cmds := self.tree.get_commands():
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Syncing %d commands: %s",
+                        len(cmds),
+                        ", ".join(cmd.name for cmd in cmds),
+                    )
+
+                guild = Object(id=self.sync_guild_id)
+                self.tree.copy_global_to(guild=guild)
+                await self.tree.sync(guild=guild)
+            else:
+                # Don't waste a HTTP roundtrip syncing an empty tree.
+                logger.warning("No commands to sync")
 
         if self.admin_ids is not None:
             logger.debug("Fetching bot owner ID")
-            self.admin_ids.add((await self.application_info()).owner.id)
+            self.admin_ids = {
+                *self.admin_ids,
+                (await self.application_info()).owner.id,
+            }
 
     async def close(self) -> None:
         # This MUST come before `await super().close()`, because certain
@@ -88,25 +107,17 @@ class WDMTABot(commands.Bot):
         error: app_commands.AppCommandError,
     ) -> None:
         if isinstance(error.__cause__, commands.NotOwner):
-            await interaction.response.send_message(
-                embed=ErrorEmbed(
-                    description="(╯°□°)╯︵ ┻━┻ You do not have permission to run this command!"
-                )
-            )
+            await interaction.response.send_message(embed=_NOT_OWNER_EMBED)
             return
 
         logger.exception("Command execution error", exc_info=error)
 
-        await (
+        send = (
             interaction.followup.send
             if interaction.response.is_done()
             else interaction.response.send_message
-        )(
-            embed=ErrorEmbed(
-                description=r"(´･_･\`) An error occurred while running the command."
-                "\nThis is probably due to a bug."
-            ).set_footer(text="Developers: check the logs for details.")
         )
+        await send(embed=_GENERIC_ERROR_EMBED)
 
 
 @typechecked
@@ -141,34 +152,58 @@ class Paginator(ui.View):
         self.format_list = format_list or self.format_list
         self.template = template or InfoEmbed()
 
-        self.page = 0
+        # Entries never change for the paginator's lifetime, so with the
+        # default formatter every line can be rendered once up front;
+        # each page is then just a slice and a join.
+        self._formatted: list[str] | None = (
+            None
+            if format_list is not None
+            else [
+                (
+                    f"**{entry}**"
+                    if type(entry) is self.ListHeading
+                    else f"\N{BULLET} {entry}"
+                )
+                for entry in entries
+            ]
+        )
 
-    @property
-    def max_page(self, /):
-        return -(len(self.entries) // -self.PAGE_SIZE) - 1
+        # Embeds already built for a page; entries are immutable, so a
+        # user bouncing between pages gets each one rebuilt only once.
+        self._embed_cache: dict[int, Embed] = {}
+
+        self.page = 0
+        # Entries never change, so the last page index is fixed too.
+        self.max_page = -(len(entries) // -self.PAGE_SIZE) - 1
 
     async def interaction_check(self, interaction: Interaction, /) -> bool:
         if interaction.user == self.interaction.user:
             return True
 
         await interaction.response.send_message(
-            embed=ErrorEmbed(description="(►__◄) This button is not for you!"),
+            embed=_NOT_FOR_YOU_EMBED,
             ephemeral=True,
         )
 
         return False
 
     def generate_embed(self, /) -> Embed:
+        if (embed := self._embed_cache.get(self.page)) is not None:
+            return embed
+
         logger.info("Generating embed for page %d", self.page)
 
         start_idx = self.page * self.PAGE_SIZE
 
         embed = self.template.copy()
-        embed.description = self.format_list(
-            self.entries[start_idx : start_idx + self.PAGE_SIZE]
+        embed.description = (
+            "\n".join(self._formatted[start_idx : start_idx + self.PAGE_SIZE])
+            if self._formatted is not None
+            else self.format_list(self.entries[start_idx : start_idx + self.PAGE_SIZE])
         )
         embed.set_footer(text=f"page {self.page + 1}/{self.max_page + 1}")
 
+        self._embed_cache[self.page] = embed
         return embed
 
     async def start(self, /) -> None:
@@ -4,10 +4,10 @@ Abstractions for interfacing with WuzAPI and processing WhatsApp data.
 
 from __future__ import annotations
 
+import asyncio
 import base64
-import json
 import logging
-import re
+import time
 import urllib.parse
 from dataclasses import dataclass
 from datetime import datetime
@@ -15,8 +15,10 @@ from http import HTTPStatus
 from pathlib import Path
 from typing import Any, AsyncIterable, Self
 
+import orjson
 from aiohttp import ClientResponse, ClientSession, web
-from typeguard import check_type, typechecked
+
+from ._typecheck import typechecked
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +36,11 @@ class MessageContent:
         if not isinstance(data, dict):
             return
 
-        if (quote_dict := data.get("contextInfo", {}).get("quotedMessage")) is not None:
+        # Single .get per level; the chained .get(..., {}) form allocated
+        # a throwaway dict on every context-less message.
+        if (context_info := data.get("contextInfo")) is not None and (
+            quote_dict := context_info.get("quotedMessage")
+        ) is not None:
             self.quote = MessageContent.from_raw(quote_dict)
 
     def __init_subclass__(cls, keys: tuple[str, ...]) -> None:
@@ -47,9 +53,12 @@ class MessageContent:
         data: dict[str, Any],
         /,
     ) -> MessageContent:
-        for key in data:
-            if subclass := cls._registry.get(key):
-                return subclass(data[key], key=key)
+        # Intersect the (small, fixed) registry with the payload keys
+        # rather than probing the registry once per key in the payload;
+        # real messages carry exactly one registered key alongside
+        # several irrelevant ones like contextInfo.
+        for key in cls._registry.keys() & data.keys():
+            return cls._registry[key](data[key], key=key)
 
         return UnknownMessageContent(None, key="")
 
@@ -64,23 +73,38 @@ class ReactionMessageContent(MessageContent, keys=("reactionMessage",)):
     def __init__(self, data: Any, /, *, key: str) -> None:
         super().__init__(data, key=key)
 
-        self.target_id = check_type(data["key"]["ID"], str)
-        self.text: str | None = check_type(data.get("text"), str | None)
+        self.target_id: str = data["key"]["ID"]
+        self.text: str | None = data.get("text")
+
 
+class TextMessageContent(MessageContent, keys=()):
+    """
+    Common base for plain-text message contents; use the per-key
+    subclasses below, which exist so construction needs no dispatch on
+    the payload key.
+    """
 
-class TextMessageContent(MessageContent, keys=("conversation", "extendedTextMessage")):
     __slots__ = ("text",)
 
+    text: str
+
+
+class ConversationTextMessageContent(TextMessageContent, keys=("conversation",)):
+    __slots__ = ()
+
     def __init__(self, data: Any, /, *, key: str) -> None:
         super().__init__(data, key=key)
 
-        self.text: str
+        self.text = data
+
+
+class ExtendedTextMessageContent(TextMessageContent, keys=("extendedTextMessage",)):
+    __slots__ = ()
+
+    def __init__(self, data: Any, /, *, key: str) -> None:
+        super().__init__(data, key=key)
 
-        match key:
-            case "conversation":
-                self.text = check_type(data, str)
-            case "extendedTextMessage":
-                self.text = check_type(data["text"], str)
+        self.text = data["text"]
 
 
 class MediaMessageContent(
@@ -94,32 +118,33 @@ class MediaMessageContent(
         "length",
         "sha256",
         "enc_sha256",
+        "_download_type",
     )
 
     def __init__(self, data: Any, /, *, key: str) -> None:
         super().__init__(data, key=key)
 
-        self.caption: str | None = check_type(data.get("caption"), str | None)
+        self.caption: str | None = data.get("caption")
 
-        self.url = check_type(data["URL"], str)
-        self.mimetype = check_type(data["mimetype"], str)
-        self.media_key = check_type(data["mediaKey"], str)
-        self.length = check_type(data["fileLength"], int)
-        self.sha256 = check_type(data["fileSHA256"], str)
-        self.enc_sha256 = check_type(data["fileEncSHA256"], str)
+        self.url: str = data["URL"]
+        self.mimetype: str = data["mimetype"]
+        self.media_key: str = data["mediaKey"]
+        self.length: int = data["fileLength"]
+        self.sha256: str = data["fileSHA256"]
+        self.enc_sha256: str = data["fileEncSHA256"]
 
-    async def fetch(self, client: WhatsAppClient, /) -> bytes:
-        download_type = self.mimetype.split("/", 1)[0]
-        if download_type == "application":
-            download_type = "document"
+        # The WuzAPI download endpoint, derived from the mimetype once
+        # here rather than on every fetch.
+        prefix = self.mimetype[: self.mimetype.index("/")]
+        self._download_type = "document" if prefix == "application" else prefix
 
-        logger.info("Fetching %s from %s", download_type, self.url)
+    async def fetch(self, client: WhatsAppClient, /) -> bytes:
+        logger.info("Fetching %s from %s", self._download_type, self.url)
 
         # TODO: this doesn't work with stickers for some reason.
 
-        async with client.session.post(
-            f"chat/download{download_type}",
-            headers={"Token": client.token},
+        data = await client._post_json(
+            f"chat/download{self._download_type}",
             json={
                 "Url": self.url,
                 "Mimetype": self.mimetype,
@@ -128,15 +153,13 @@ class MediaMessageContent(
                 "FileSHA256": self.sha256,
                 "FileEncSHA256": self.enc_sha256,
             },
-        ) as response:
-            if response.status != HTTPStatus.OK:
-                raise await client.RequestError.from_response(response)
+        )
 
-            return base64.b64decode(
-                check_type((await response.json())["data"]["Data"], str).split(",", 1)[
-                    1
-                ]
-            )
+        # Slice off the data-URL prefix at the bytes level; str.split
+        # would copy the multi-MB payload an extra time, and a memoryview
+        # lets b64decode read the base64 region without copying it.
+        b64 = data["data"]["Data"].encode("ascii")
+        return base64.b64decode(memoryview(b64)[b64.index(b",") + 1 :])
 
 
 class PollMessageContent(MessageContent, keys=("pollCreationMessage",)):
@@ -145,14 +168,14 @@ class PollMessageContent(MessageContent, keys=("pollCreationMessage",)):
     def __init__(self, data: Any, /, *, key: str) -> None:
         super().__init__(data, key=key)
 
-        self.name = check_type(data["name"], str)
-        self.options = (
-            [check_type(option["optionName"], str) for option in options]
+        self.name: str = data["name"]
+        self.options: list[str] | None = (
+            [option["optionName"] for option in options]
             if (options := data.get("options")) is not None
             else None
         )
         self.multiple_allowed = (
-            check_type(count, int) == 0
+            count == 0
             if (count := data.get("selectableOptionsCount")) is not None
             else None
         )
@@ -220,10 +243,45 @@ class User:
     verified_name_issuer: str | None
 
 
+def _parse_groups(raw: bytes, /) -> tuple[dict[str, Group], dict[str, str]]:
+    """
+    Decodes a raw group/list response body into the group cache dicts
+    (JID -> Group and casefolded name -> JID). CPU-bound for accounts
+    with many groups, so run it off the event loop.
+    """
+    group_cache: dict[str, Group] = {}
+    group_by_cf_name: dict[str, str] = {}
+
+    # Bind the loop invariant as a local; the attribute lookups
+    # add up over an account with many groups.
+    fromisoformat = datetime.fromisoformat
+
+    for group_entry in orjson.loads(raw)["data"]["Groups"]:
+        jid = group_entry["JID"]
+        name = group_entry["Name"]
+        topic = group_entry["Topic"] or None
+
+        group_by_cf_name[name.casefold()] = jid
+        group_cache[jid] = Group(
+            jid=jid,
+            name=name,
+            name_set_at=fromisoformat(group_entry["NameSetAt"]),
+            topic=topic,
+            topic_set_at=(fromisoformat(group_entry["TopicSetAt"]) if topic else None),
+            is_announce=group_entry["IsAnnounce"],
+            is_ephemeral=group_entry["IsEphemeral"],
+            is_locked=group_entry["IsLocked"],
+        )
+
+    return group_cache, group_by_cf_name
+
+
 @typechecked
 class WhatsAppClient:
-    _MESSAGE_CACHE_SIZE = 10_000
-    _WEBHOOK_DATA_PATTERN = re.compile("^jsonData=(.+)&token=.*?$")
+    # How long a group-cache refresh stays valid before lookups trigger
+    # another one; keeps renamed/new groups from going unnoticed forever
+    # without refetching the list on every lookup.
+    _GROUP_CACHE_TTL = 300.0
 
     class WhatsAppException(Exception): ...
 
@@ -260,30 +318,80 @@ class WhatsAppClient:
 
         self._dump_io = None if dump_file_path is None else dump_file_path.open("a")
 
+        # Webhook payloads destined for the dump file; drained by a
+        # background writer so the webhook handler never blocks on disk.
+        self._dump_queue: asyncio.Queue[str | None] = asyncio.Queue()
+        self._dump_task: asyncio.Task[None] | None = None
+
         # mapping of group JIDs to Groups
         self._group_cache: dict[str, Group] = {}
+        # inverted mapping of casefolded group names to JIDs, so name
+        # lookups are a single dict hit instead of a scan
+        self._group_by_cf_name: dict[str, str] = {}
+        # when the group cache was last refreshed; -inf forces a refresh
+        # on first use
+        self._group_cache_time = float("-inf")
+
+        # In-flight avatar fetches, so concurrent callers asking for the
+        # same JID share one WuzAPI round trip instead of stacking
+        # duplicates.
+        self._avatar_fetches: dict[tuple[str, bool], asyncio.Task[str]] = {}
 
     async def on_message(self, message: Message, /) -> None:
         # dummy implementation
         del message
 
+    async def _post_json(self, path: str, /, *, json: Any = None) -> Any:
+        """
+        POSTs to a WuzAPI endpoint and returns the decoded response body.
+        Raises RequestError on a non-OK response.
+        """
+        async with self.session.post(
+            path, headers={"Token": self.token}, json=json
+        ) as response:
+            if response.status != HTTPStatus.OK:
+                raise await self.RequestError.from_response(response)
+
+            # orjson takes bytes directly, skipping aiohttp's charset
+            # sniff and the bytes-to-str decode that response.json()
+            # would do.
+            return orjson.loads(await response.read())
+
+    async def _get_raw(self, path: str, /) -> bytes:
+        """
+        GETs a WuzAPI endpoint and returns the raw response body, leaving
+        decoding to the caller. Raises RequestError on a non-OK response.
+        """
+        async with self.session.get(path, headers={"Token": self.token}) as response:
+            if response.status != HTTPStatus.OK:
+                raise await self.RequestError.from_response(response)
+
+            return await response.read()
+
     async def _handle_webhook(self, request: web.Request):
         logger.info("Processing incoming webhook request from %s", request.remote)
 
-        data_match = re.match(
-            self._WEBHOOK_DATA_PATTERN,
-            urllib.parse.unquote(urllib.parse.unquote_plus(await request.text())),
+        # Parse the form body in one pass instead of percent-decoding the
+        # whole thing and regex-scanning it; only the jsonData value needs
+        # decoding, and parse_qsl already unquotes it once.
+        form = dict(
+            urllib.parse.parse_qsl(await request.text(), keep_blank_values=True)
         )
-        if not data_match:
+
+        data_group = form.get("jsonData")
+        if data_group is None:
             logger.error("Failed to match webhook data")
             return web.Response()
 
-        data = json.loads(data_group := data_match.group(1))
+        # WuzAPI double-encodes the payload, so a second unquote is
+        # needed whenever escapes survived the first.
+        if "%" in data_group:
+            data_group = urllib.parse.unquote(data_group)
+
+        data = orjson.loads(data_group)
 
         if self._dump_io is not None:
-            self._dump_io.write(data_group)
-            self._dump_io.write("\n")
-            self._dump_io.flush()
+            self._dump_queue.put_nowait(data_group)
 
         match data["type"]:
             case "Message":
@@ -314,12 +422,44 @@ class WhatsAppClient:
 
         return web.Response()
 
+    async def _dump_writer(self, /) -> None:
+        assert self._dump_io is not None
+
+        while True:
+            stop = False
+            entries: list[str] = []
+
+            # Drain everything already queued so a burst of webhooks
+            # costs one write and one flush instead of one per event.
+            entry = await self._dump_queue.get()
+            while True:
+                if entry is None:
+                    stop = True
+                    break
+
+                entries.append(entry)
+
+                try:
+                    entry = self._dump_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+
+            if entries:
+                self._dump_io.writelines(f"{entry}\n" for entry in entries)
+                self._dump_io.flush()
+
+            if stop:
+                return
+
     async def setup(self, /):
         """Sets up the WhatsApp client, registering the webhook with WuzAPI."""
         logger.info(
             "Starting webhook server on %s:%d", self.webhook_host, self.webhook_port
         )
 
+        if self._dump_io is not None:
+            self._dump_task = asyncio.create_task(self._dump_writer())
+
         app = web.Application()
         app.add_routes([web.post("/", self._handle_webhook)])
         self._webhook_server = web.AppRunner(app)
@@ -334,46 +474,31 @@ class WhatsAppClient:
 
         logger.info("Setting up WuzAPI webhook")
 
-        async with self.session.post(
-            "webhook",
-            headers={"Token": self.token},
-            json={"webhookURL": f"http://{self.webhook_host}:{self.webhook_port}/"},
-        ) as response:
-            if response.status == HTTPStatus.OK:
-                if logger.isEnabledFor(logging.INFO):
-                    logger.info("Webhook setup successful: %s", await response.json())
-            else:
-                if logger.isEnabledFor(logging.ERROR):
-                    logger.error(
-                        "Webhook setup failed with HTTP %d: %s",
-                        response.status,
-                        await response.json(),
-                    )
-                raise await self.RequestError.from_response(response)
+        logger.info(
+            "Webhook setup successful: %s",
+            await self._post_json(
+                "webhook",
+                json={
+                    "webhookURL": f"http://{self.webhook_host}:{self.webhook_port}/"
+                },
+            ),
+        )
 
     async def connect(self, /) -> None:
         logger.info("Connecting to WuzAPI")
 
-        async with self.session.post(
+        await self._post_json(
             "session/connect",
-            headers={"Token": self.token},
             json={
                 "Subscribe": ["Message"],
                 "Immediate": "false",
             },
-        ) as response:
-            if response.status != HTTPStatus.OK:
-                raise await self.RequestError.from_response(response)
+        )
 
     async def disconnect(self, /) -> None:
         logger.info("Disconnecting from WhatsApp")
 
-        async with self.session.post(
-            "session/disconnect",
-            headers={"Token": self.token},
-        ) as response:
-            if response.status != HTTPStatus.OK:
-                raise await self.RequestError.from_response(response)
+        await self._post_json("session/disconnect")
 
     async def cleanup(self, /) -> None:
         """Cleans up state associated with the WhatsApp client."""
@@ -381,51 +506,43 @@ class WhatsAppClient:
 
         await self._webhook_server.cleanup()
 
+        if self._dump_task is not None:
+            # Flush whatever the writer has not gotten to yet.
+            self._dump_queue.put_nowait(None)
+            await self._dump_task
+            self._dump_task = None
+
         if self._dump_io is not None:
             self._dump_io.close()
 
     async def get_pairing_code(self, phone: str, /) -> str:
         """Requests for a pairing code for the given phone number."""
-        async with self.session.post(
-            "session/pairphone",
-            headers={"Token": self.token},
-            json={"Phone": phone},
-        ) as response:
-            if response.status != HTTPStatus.OK.value:
-                raise await self.RequestError.from_response(response)
+        return (
+            await self._post_json("session/pairphone", json={"Phone": phone})
+        )["data"]["LinkingCode"]
 
-            return (await response.json())["data"]["LinkingCode"]
+    def _group_cache_stale(self, /) -> bool:
+        return time.monotonic() - self._group_cache_time > self._GROUP_CACHE_TTL
 
     async def _refresh_group_cache(self, /) -> None:
-        async with self.session.get(
-            "group/list", headers={"Token": self.token}
-        ) as response:
-            if response.status != HTTPStatus.OK.value:
-                raise await self.RequestError.from_response(response)
+        raw = await self._get_raw("group/list")
 
-            logger.info("Refreshing group cache")
-
-            self._group_cache.clear()
-
-            for group_entry in (await response.json())["data"]["Groups"]:
-                self._group_cache[group_entry["JID"]] = Group(
-                    jid=group_entry["JID"],
-                    name=group_entry["Name"],
-                    name_set_at=datetime.fromisoformat(group_entry["NameSetAt"]),
-                    topic=group_entry["Topic"] or None,
-                    topic_set_at=(
-                        datetime.fromisoformat(group_entry["TopicSetAt"])
-                        if group_entry["Topic"]
-                        else None
-                    ),
-                    is_announce=group_entry["IsAnnounce"],
-                    is_ephemeral=group_entry["IsEphemeral"],
-                    is_locked=group_entry["IsLocked"],
-                )
+        logger.info("Refreshing group cache")
+
+        # Parsing a large group list is pure CPU work, so it happens on a
+        # worker thread instead of stalling webhook handling; the fresh
+        # dicts are swapped in atomically afterwards, so anything
+        # iterating the old cache across an await never sees it
+        # half-built.
+        group_cache, group_by_cf_name = await asyncio.to_thread(_parse_groups, raw)
+
+        self._group_cache = group_cache
+        self._group_by_cf_name = group_by_cf_name
+        self._group_cache_time = time.monotonic()
 
     async def get_groups(self, /) -> AsyncIterable[Group]:
         """Retrieves an asynchronous iterable of Groups."""
-        if not self._group_cache:
+        if self._group_cache_stale():
             await self._refresh_group_cache()
 
         for group in self._group_cache.values():
@@ -438,64 +555,70 @@ class WhatsAppClient:
         """
         name = name.casefold()
 
-        async for group in self.get_groups():
-            if group.name.casefold() == name:
-                return group
+        if (
+            self._group_cache_stale()
+            or (jid := self._group_by_cf_name.get(name)) is None
+        ):
+            await self._refresh_group_cache()
+            jid = self._group_by_cf_name.get(name)
 
-        return None
+        return self._group_cache[jid] if jid is not None else None
 
     async def get_group_name_from_jid(self, jid: str, /) -> str | None:
         """
         Retrieves a group name from its JID.
         Returns the name, or None if no matching group is found.
         """
-        if group := self._group_cache.get(jid):
-            return group.name
-
-        await self._refresh_group_cache()
-
-        if group := self._group_cache.get(jid):
-            return group.name
+        if self._group_cache_stale() or (group := self._group_cache.get(jid)) is None:
+            await self._refresh_group_cache()
+            group = self._group_cache.get(jid)
 
-        return None
+        return group.name if group is not None else None
 
     async def get_users(self, jids: list[str], /) -> AsyncIterable[User]:
         """
         Gets an asynchronous iterable of users, including known contacts, by their JIDs.
         """
-        async with self.session.post(
-            "user/info",
-            headers={"Token": self.token},
-            json={"Phone": jids},
-        ) as response:
-            if response.status != HTTPStatus.OK.value:
-                raise await self.RequestError.from_response(response)
-
-            for user_entry in (await response.json())["data"]["Users"].values():
-                yield User(
-                    status=user_entry["Status"],
-                    verified_name=(
-                        user_entry["VerifiedName"]["verifiedName"]
-                        if user_entry["VerifiedName"]
-                        else None
-                    ),
-                    verified_name_issuer=(
-                        user_entry["VerifiedName"]["issuer"]
-                        if user_entry["VerifiedName"]
-                        else None
-                    ),
-                )
+        users = (await self._post_json("user/info", json={"Phone": jids}))["data"][
+            "Users"
+        ]
+
+        for user_entry in users.values():
+            yield User(
+                status=user_entry["Status"],
+                verified_name=(
+                    user_entry["VerifiedName"]["verifiedName"]
+                    if user_entry["VerifiedName"]
+                    else None
+                ),
+                verified_name_issuer=(
+                    user_entry["VerifiedName"]["issuer"]
+                    if user_entry["VerifiedName"]
+                    else None
+                ),
+            )
 
     async def get_user_avatar(self, jid: str, /, *, preview: bool = False) -> str:
         """
         Retrieves a user's WhatsApp avatar.
+        Concurrent requests for the same JID are coalesced into a single
+        WuzAPI call.
         """
-        async with self.session.post(
-            "user/avatar",
-            headers={"Token": self.token},
-            json={"Phone": jid, "Preview": preview},
-        ) as response:
-            if response.status != HTTPStatus.OK.value:
-                raise await self.RequestError.from_response(response)
+        key = (jid, preview)
+
+        if (fetch := self._avatar_fetches.get(key)) is None:
+            fetch = self._avatar_fetches[key] = asyncio.ensure_future(
+                self._fetch_user_avatar(jid, preview=preview)
+            )
+            fetch.add_done_callback(lambda _: self._avatar_fetches.pop(key, None))
 
-            return (await response.json())["data"]["url"]
+        # Shielded so one cancelled caller does not cancel the fetch out
+        # from under the others awaiting it.
+        return await asyncio.shield(fetch)
+
+    async def _fetch_user_avatar(self, jid: str, /, *, preview: bool) -> str:
+        return (
+            await self._post_json(
+                "user/avatar", json={"Phone": jid, "Preview": preview}
+            )
+        )["data"]["url"]